@@ -2,11 +2,14 @@
 Test configuration and fixtures for API testing
 """
 
+import copy
 import pytest
+import pytest_asyncio
 import asyncio
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from fastapi import FastAPI
 from fastapi import Form, UploadFile, Query
 from fastapi import status
@@ -1870,6 +1873,15 @@ def create_test_app():
             "note": "This is a mock implementation for testing purposes"
         }
     
+    # Expose the in-memory tables so fixtures can roll back per-test writes
+    app.state.mock_store = {
+        "domains": mock_domains,
+        "documents": mock_documents,
+        "document_chunks": mock_document_chunks,
+        "chats": mock_chats,
+        "chat_messages": mock_chat_messages,
+    }
+    
     return app
 
 
@@ -1881,6 +1893,47 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def test_app() -> FastAPI:
+    """Build the test FastAPI application once per session."""
+    return create_test_app()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Async HTTP client bound to the shared test app for the whole session."""
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def seeded_domains(test_app: FastAPI) -> list:
+    """Insert 20 read-only domains straight into the shared app's store."""
+    now = datetime.now(timezone.utc)
+    domains = [
+        {
+            "id": str(uuid4()),
+            "name": f"Seeded Test Domain {i}",
+            "description": f"Seeded domain {i} for read-only tests",
+            "created_at": now,
+            "updated_at": now
+        }
+        for i in range(20)
+    ]
+    test_app.state.mock_store["domains"].extend(domains)
+    return domains
+
+
+@pytest.fixture
+def mock_store_rollback(test_app: FastAPI) -> Generator[None, None, None]:
+    """Restore the shared app's in-memory tables after each test."""
+    store = test_app.state.mock_store
+    snapshot = {name: copy.deepcopy(rows) for name, rows in store.items()}
+    yield
+    for name, rows in snapshot.items():
+        store[name][:] = rows
+
+
 @pytest.fixture
 def client() -> Generator[TestClient, None, None]:
     """Create a test client for the FastAPI application."""
@@ -0,0 +1,21 @@
+"""
+Factories that insert rows straight into the test app's in-memory store
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+
+def make_domain(store: dict, **overrides) -> dict:
+    """Add a domain row to the store, bypassing HTTP, and return it"""
+    now = datetime.now(timezone.utc)
+    domain = {
+        "id": str(uuid4()),
+        "name": "Factory Domain",
+        "description": "Domain created by the test factory",
+        "created_at": now,
+        "updated_at": now,
+        **overrides
+    }
+    store["domains"].append(domain)
+    return domain
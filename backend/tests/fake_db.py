@@ -0,0 +1,65 @@
+"""
+Hand-written async session fakes for service-layer unit tests
+"""
+
+
+class FakeResult:
+    """Predetermined result returned by FakeAsyncSession.execute."""
+    
+    def __init__(self, one=None, many=()):
+        self._one, self._many = one, many
+    
+    def _value(self):
+        if isinstance(self._one, Exception):
+            raise self._one
+        return self._one
+    
+    def scalar_one(self):
+        return self._value()
+    
+    def scalar_one_or_none(self):
+        return self._value()
+    
+    def scalar(self):
+        return self._value()
+    
+    def scalars(self):
+        return self
+    
+    def all(self):
+        return self._many
+    
+    def first(self):
+        return self._many[0] if self._many else None
+
+
+class FakeAsyncSession:
+    """In-memory stand-in for AsyncSession that records what it was asked to do."""
+    
+    def __init__(self):
+        self.added = []
+        self.deleted = []
+        self.refreshed = []
+        self.executed = []
+        self.committed = 0
+        self.rolled_back = 0
+        self.next_result = None
+    
+    def add(self, obj):
+        self.added.append(obj)
+    
+    async def commit(self):
+        self.committed += 1
+    
+    async def rollback(self):
+        self.rolled_back += 1
+    
+    async def refresh(self, obj):
+        self.refreshed.append(obj)
+    
+    async def delete(self, obj):
+        self.deleted.append(obj)
+    
+    async def execute(self, statement):
+        self.executed.append(statement)
+        return self.next_result
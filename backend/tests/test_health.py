@@ -4,39 +4,43 @@ Tests for health endpoint
 
 import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+
+@pytest.fixture(scope="module")
+def health_handlers(test_app: FastAPI):
+    """Health endpoint functions keyed by path, for calling without HTTP"""
+    return {
+        route.path: route.endpoint
+        for route in test_app.routes
+        if isinstance(route, APIRoute) and "health" in route.path
+    }
 
 
 class TestHealthEndpoint:
     """Test health endpoint functionality"""
     
     @pytest.mark.api
-    def test_health_check(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_health_check(self, async_client: AsyncClient):
         """Test basic health check endpoint"""
-        response = client.get("/api/v1/health/")
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
-        assert "status" in data
-        assert data["status"] == "healthy"
-    
-    @pytest.mark.api
-    def test_health_check_sync(self, client: TestClient):
-        """Test health check with sync client"""
-        response = client.get("/api/v1/health/")
+        response = await async_client.get("/api/v1/health/", follow_redirects=True)
         assert response.status_code == status.HTTP_200_OK
         
         data = response.json()
         assert "status" in data
+        assert "timestamp" in data
+        assert "version" in data
+        assert "environment" in data
         assert data["status"] == "healthy"
     
     @pytest.mark.api
-    def test_health_detailed(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_health_detailed(self, health_handlers):
         """Test detailed health check endpoint"""
-        response = client.get("/api/v1/health/detailed")
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
+        data = await health_handlers["/api/v1/health/detailed"]()
         assert "status" in data
         assert "timestamp" in data
         assert "version" in data
@@ -49,39 +53,24 @@ class TestHealthEndpoint:
         assert isinstance(data["environment"], str)
     
     @pytest.mark.api
-    def test_health_ready(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_health_ready(self, health_handlers):
         """Test readiness check endpoint"""
-        response = client.get("/api/v1/health/ready")
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
+        data = await health_handlers["/api/v1/health/ready"]()
         assert "status" in data
         assert data["status"] == "ready"
     
     @pytest.mark.api
-    def test_health_live(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_health_live(self, health_handlers):
         """Test liveness check endpoint"""
-        response = client.get("/health")
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
+        data = await health_handlers["/health"]()
         assert "status" in data
         assert data["status"] == "healthy"
     
     @pytest.mark.api
-    def test_health_metrics(self, client: TestClient):
-        """Test metrics endpoint - using basic health as metrics endpoint doesn't exist in mock"""
-        response = client.get("/api/v1/health/")
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
-        assert "status" in data
-        assert "timestamp" in data
-        assert "version" in data
-        assert "environment" in data
-    
-    @pytest.mark.api
-    def test_health_invalid_endpoint(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_health_invalid_endpoint(self, async_client: AsyncClient):
         """Test invalid health endpoint returns 404"""
-        response = client.get("/api/v1/health/invalid")
+        response = await async_client.get("/api/v1/health/invalid")
         assert response.status_code == status.HTTP_404_NOT_FOUND
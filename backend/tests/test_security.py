@@ -3,29 +3,58 @@ Security and Validation Testing
 Tests for security features, input validation, and security headers
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from unittest.mock import Mock, patch
 import json
 import os
+import tempfile
 from io import BytesIO
 
 from app.main import app
 from app.core.config import settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Test client fixture"""
+    """Test client fixture, shared by every test in the module"""
     return TestClient(app)
 
 
+@pytest.fixture(scope="module")
+def openapi_response(client):
+    """OpenAPI schema response, fetched once for the module"""
+    return client.get("/api/v1/openapi.json")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def main_async_client():
+    """Async client for app.main; named apart from conftest's mock-app async_client"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as ac:
+        yield ac
+
+
 @pytest.fixture
 def mock_file():
     """Mock file for testing"""
     return BytesIO(b"test file content")
 
 
+@pytest.fixture
+def oversized_file():
+    """Temporary file just over MAX_FILE_SIZE, written without holding it in memory"""
+    chunk = b"x" * 65536
+    remaining = settings.MAX_FILE_SIZE + 1024
+    with tempfile.TemporaryFile() as f:
+        while remaining > 0:
+            remaining -= f.write(chunk[:remaining])
+        f.seek(0)
+        yield f
+
+
 class TestSecurityHeaders:
     """Test security headers and middleware"""
     
@@ -91,91 +120,58 @@ class TestInputValidation:
         )
         assert response.status_code == 422
     
-    def test_query_parameter_validation(self, client):
-        """Test query parameter validation"""
-        # Test invalid skip value
-        response = client.get("/api/v1/documents/?skip=-1")
-        assert response.status_code == 422
-        
-        # Test invalid limit value
-        response = client.get("/api/v1/documents/?limit=0")
-        assert response.status_code == 422
-        
-        # Test limit too high
-        response = client.get("/api/v1/documents/?limit=1001")
-        assert response.status_code == 422
-    
-    def test_uuid_validation(self, client):
-        """Test UUID format validation"""
-        # Test invalid UUID format
-        response = client.get("/api/v1/documents/?domain_id=invalid-uuid")
-        assert response.status_code == 422
-        
-        # Test valid UUID format
-        response = client.get("/api/v1/documents/?domain_id=123e4567-e89b-12d3-a456-426614174000")
-        assert response.status_code == 200
-    
-    def test_sql_injection_prevention(self, client):
-        """Test SQL injection prevention"""
-        # Test with potentially malicious search terms
-        malicious_terms = [
-            "'; DROP TABLE documents; --",
-            "' OR '1'='1",
-            "'; INSERT INTO users VALUES ('hacker', 'password'); --",
-            "'; UPDATE users SET password='hacked'; --"
-        ]
-        
-        for term in malicious_terms:
-            response = client.get(f"/api/v1/documents/?search={term}")
-            # Should not crash or expose database errors
-            assert response.status_code in [200, 422, 400]
-            
-            # Check that no sensitive information is exposed
-            if response.status_code == 200:
-                content = response.json()
-                assert "error" not in str(content).lower()
-                assert "sql" not in str(content).lower()
-                assert "database" not in str(content).lower()
+    @pytest.mark.parametrize("term", [
+        "'; DROP TABLE documents; --",
+        "' OR '1'='1",
+        "'; INSERT INTO users VALUES ('hacker', 'password'); --",
+        "'; UPDATE users SET password='hacked'; --"
+    ])
+    def test_sql_injection_prevention(self, client, term):
+        """Test SQL injection prevention with potentially malicious search terms"""
+        response = client.get(f"/api/v1/documents/?search={term}")
+        # Should not crash or expose database errors
+        assert response.status_code in [200, 422, 400]
+        
+        # Check that no sensitive information is exposed
+        if response.status_code == 200:
+            blob = json.dumps(response.json()).lower()
+            assert not any(kw in blob for kw in ("error", "sql", "database"))
 
 
 class TestFileUploadSecurity:
     """Test file upload security measures"""
     
-    def test_file_extension_validation(self, client):
-        """Test file extension validation"""
-        # Test with allowed extensions
-        allowed_extensions = ["pdf", "docx", "txt", "md"]
-        for ext in allowed_extensions:
-            filename = f"test.{ext}"
-            response = client.post(
-                "/api/v1/documents/",
-                data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
-                files={"file": (filename, b"test content")}
-            )
-            # Should not fail due to extension
-            assert response.status_code in [201, 400, 422]
-        
-        # Test with disallowed extensions
-        disallowed_extensions = ["exe", "bat", "sh", "js", "php", "py"]
-        for ext in disallowed_extensions:
-            filename = f"test.{ext}"
-            response = client.post(
-                "/api/v1/documents/",
-                data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
-                files={"file": (filename, b"test content")}
-            )
-            # Should fail due to extension
-            assert response.status_code in [400, 422]
+    @pytest.mark.parametrize("ext", ["pdf", "docx", "txt", "md"])
+    def test_allowed_file_extension(self, client, ext):
+        """Test file extension validation with allowed extensions"""
+        response = client.post(
+            "/api/v1/documents/",
+            data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
+            files={"file": (f"test.{ext}", b"test content")}
+        )
+        # Should not fail due to extension
+        assert response.status_code in [201, 400, 422]
     
-    def test_file_size_validation(self, client):
-        """Test file size validation"""
-        # Create a file larger than MAX_FILE_SIZE
-        large_content = b"x" * (settings.MAX_FILE_SIZE + 1024)
-        
+    @pytest.mark.parametrize("ext", ["exe", "bat", "sh", "js", "php", "py"])
+    def test_disallowed_file_extension(self, client, ext):
+        """Test file extension validation with disallowed extensions"""
         response = client.post(
             "/api/v1/documents/",
             data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
-            files={"file": ("large_file.txt", large_content)}
+            files={"file": (f"test.{ext}", b"test content")}
+        )
+        # Should fail due to extension
+        assert response.status_code in [400, 422]
+    
+    @pytest.mark.asyncio
+    async def test_file_size_validation(self, main_async_client, oversized_file):
+        """Test file size validation"""
+        # Upload a file larger than MAX_FILE_SIZE. ASGITransport streams the
+        # multipart body in 64 KiB chunks; TestClient would read it all at once
+        response = await main_async_client.post(
+            "/api/v1/documents/",
+            data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
+            files={"file": ("large_file.txt", oversized_file)}
         )
         
         # Should fail due to file size
@@ -199,44 +195,34 @@ class TestFileUploadSecurity:
         # Should not crash or execute malicious code
         assert response.status_code in [201, 400, 422]
     
-    def test_filename_sanitization(self, client):
-        """Test filename sanitization"""
-        # Test with potentially dangerous filenames
-        dangerous_filenames = [
-            "../../../etc/passwd",
-            "file with spaces.txt",
-            "file-with-special-chars-!@#$%^&*().txt",
-            "file_with_unicode_测试.txt",
-            "file_with_newlines\n.txt",
-            "file_with_tabs\t.txt"
-        ]
+    @pytest.mark.parametrize("filename", [
+        "../../../etc/passwd",
+        "file with spaces.txt",
+        "file-with-special-chars-!@#$%^&*().txt",
+        "file_with_unicode_测试.txt",
+        "file_with_newlines\n.txt",
+        "file_with_tabs\t.txt"
+    ])
+    def test_filename_sanitization(self, client, filename):
+        """Test filename sanitization with potentially dangerous filenames"""
+        response = client.post(
+            "/api/v1/documents/",
+            data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
+            files={"file": (filename, b"test content")}
+        )
         
-        for filename in dangerous_filenames:
-            response = client.post(
-                "/api/v1/documents/",
-                data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
-                files={"file": (filename, b"test content")}
-            )
-            
-            # Should handle safely
-            assert response.status_code in [201, 400, 422]
+        # Should handle safely
+        assert response.status_code in [201, 400, 422]
 
 
 class TestAuthenticationSecurity:
     """Test authentication and authorization security"""
     
-    def test_authentication_endpoints_exist(self, client):
-        """Test that authentication endpoints are properly configured"""
-        # Test auth health endpoint
-        response = client.get("/api/v1/auth/health")
-        assert response.status_code == 200
-        
-        # Test that auth endpoints are documented
-        response = client.get("/api/v1/openapi.json")
-        assert response.status_code == 200
-        
-        openapi_spec = response.json()
-        paths = openapi_spec.get("paths", {})
+    def test_authentication_endpoints_exist(self, openapi_response):
+        """Test that authentication endpoints are documented"""
+        # The auth health endpoint itself is exercised by test_jwt_token_validation
+        assert openapi_response.status_code == 200
+        paths = openapi_response.json().get("paths", {})
         
         # Check that auth paths exist
         assert "/auth/health" in paths
@@ -269,13 +255,13 @@ class TestAuthenticationSecurity:
 class TestAPISecurity:
     """Test general API security measures"""
     
-    def test_rate_limiting_headers(self, client):
+    @pytest.mark.asyncio
+    async def test_rate_limiting_headers(self, main_async_client):
         """Test rate limiting headers (when implemented)"""
-        # Make multiple requests to test rate limiting
-        responses = []
-        for _ in range(10):
-            response = client.get("/api/v1/health")
-            responses.append(response)
+        # Make multiple concurrent requests to test rate limiting
+        responses = await asyncio.gather(*[
+            main_async_client.get("/api/v1/health") for _ in range(10)
+        ])
         
         # All requests should succeed (rate limiting not yet implemented)
         for response in responses:
@@ -286,18 +272,16 @@ class TestAPISecurity:
         # - Rate limit enforcement
         # - Rate limit reset timing
     
-    def test_error_message_security(self, client):
+    @pytest.mark.asyncio
+    async def test_error_message_security(self, main_async_client):
         """Test that error messages don't expose sensitive information"""
         # Test with invalid input
-        response = client.get("/api/v1/documents/?domain_id=invalid")
+        response = await main_async_client.get("/api/v1/documents/?domain_id=invalid")
         assert response.status_code == 422
         
         # Check that error message doesn't expose internal details
-        error_content = response.json()
-        assert "database" not in str(error_content).lower()
-        assert "sql" not in str(error_content).lower()
-        assert "internal" not in str(error_content).lower()
-        assert "stack" not in str(error_content).lower()
+        blob = json.dumps(response.json()).lower()
+        assert not any(kw in blob for kw in ("database", "sql", "internal", "stack"))
     
     def test_logging_security(self, client):
         """Test that logging doesn't expose sensitive information"""
@@ -313,62 +297,45 @@ class TestAPISecurity:
         
         # Check logs don't contain sensitive data (this would need log inspection)
         # In a real test, we would check the actual log files
-    
-    def test_csrf_protection(self, client):
-        """Test CSRF protection measures"""
-        # Test that API accepts requests without CSRF tokens
-        # (REST APIs typically don't need CSRF protection)
-        response = client.post(
-            "/api/v1/documents/",
-            data={"domain_id": "123e4567-e89b-12d3-a456-426614174000"},
-            files={"file": ("test.txt", b"test content")}
-        )
-        
-        # Should not fail due to missing CSRF token
-        assert response.status_code in [201, 400, 422]
 
 
 class TestDataValidation:
     """Test data validation and sanitization"""
     
-    def test_domain_id_validation(self, client):
-        """Test domain ID validation"""
-        # Test with invalid UUID
-        response = client.get("/api/v1/documents/?domain_id=not-a-uuid")
-        assert response.status_code == 422
-        
-        # Test with valid UUID
-        response = client.get("/api/v1/documents/?domain_id=123e4567-e89b-12d3-a456-426614174000")
-        assert response.status_code == 200
+    @pytest.mark.parametrize("domain_id,expected", [
+        ("invalid-uuid", 422),
+        ("not-a-uuid", 422),
+        ("123e4567-e89b-12d3-a456-426614174000", 200)
+    ])
+    @pytest.mark.asyncio
+    async def test_domain_id_validation(self, main_async_client, domain_id, expected):
+        """Test domain ID UUID format validation"""
+        response = await main_async_client.get(f"/api/v1/documents/?domain_id={domain_id}")
+        assert response.status_code == expected
     
-    def test_pagination_validation(self, client):
+    @pytest.mark.parametrize("params,expected", [
+        ("skip=-1", 422),
+        ("limit=0", 422),
+        ("limit=1001", 422),
+        ("skip=0&limit=10", 200)
+    ])
+    @pytest.mark.asyncio
+    async def test_pagination_validation(self, main_async_client, params, expected):
         """Test pagination parameter validation"""
-        # Test negative skip
-        response = client.get("/api/v1/documents/?skip=-1")
-        assert response.status_code == 422
-        
-        # Test zero limit
-        response = client.get("/api/v1/documents/?limit=0")
-        assert response.status_code == 422
-        
-        # Test limit too high
-        response = client.get("/api/v1/documents/?limit=1001")
-        assert response.status_code == 422
-        
-        # Test valid pagination
-        response = client.get("/api/v1/documents/?skip=0&limit=10")
-        assert response.status_code == 200
+        response = await main_async_client.get(f"/api/v1/documents/?{params}")
+        assert response.status_code == expected
     
-    def test_search_parameter_validation(self, client):
+    @pytest.mark.asyncio
+    async def test_search_parameter_validation(self, main_async_client):
         """Test search parameter validation"""
         # Test with very long search terms
         long_search = "a" * 1000
-        response = client.get(f"/api/v1/documents/?search={long_search}")
+        response = await main_async_client.get(f"/api/v1/documents/?search={long_search}")
         assert response.status_code in [200, 400, 422]
         
         # Test with special characters
         special_chars = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        response = client.get(f"/api/v1/documents/?search={special_chars}")
+        response = await main_async_client.get(f"/api/v1/documents/?search={special_chars}")
         assert response.status_code in [200, 400, 422]
 
 
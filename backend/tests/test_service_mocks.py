@@ -5,56 +5,58 @@ Tests for service layer mocking and testing utilities
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timezone
+from types import SimpleNamespace
+from tests.fake_db import FakeResult
+
+
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class MockService:
+    """Minimal service used to exercise the mocking helpers"""
+
+    def __init__(self, db, now=lambda: datetime.now(timezone.utc)):
+        self.db = db
+        self._now = now
+
+    async def create_item(self, item_data):
+        """Mock create item method"""
+        mock_item = SimpleNamespace(
+            id=1,
+            name=item_data.get("name"),
+            description=item_data.get("description"),
+            created_at=self._now()
+        )
+
+        await self.db.add(mock_item)
+        await self.db.commit()
+        await self.db.refresh(mock_item)
+
+        return mock_item
+
+    async def get_item_by_id(self, item_id):
+        """Mock get item by ID method"""
+        mock_item = SimpleNamespace(id=item_id, name="Test Item")
+
+        self.db.execute.return_value = FakeResult(one=mock_item)
+
+        return mock_item
+
+    async def get_items(self, page=1, size=10):
+        """Mock get items method with pagination"""
+        mock_items = [SimpleNamespace(id=i, name=f"Item {i}") for i in range(1, size + 1)]
+
+        self.db.execute.return_value = FakeResult(many=mock_items)
+
+        return mock_items
 
 
 class TestServiceMocking:
     """Test service layer mocking functionality"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def mock_service_class(self):
-        """Create a mock service class for testing"""
-        class MockService:
-            def __init__(self, db):
-                self.db = db
-            
-            async def create_item(self, item_data):
-                """Mock create item method"""
-                mock_item = MagicMock()
-                mock_item.id = 1
-                mock_item.name = item_data.get("name")
-                mock_item.description = item_data.get("description")
-                mock_item.created_at = datetime.now(timezone.utc)
-                
-                await self.db.add(mock_item)
-                await self.db.commit()
-                await self.db.refresh(mock_item)
-                
-                return mock_item
-            
-            async def get_item_by_id(self, item_id):
-                """Mock get item by ID method"""
-                mock_item = MagicMock()
-                mock_item.id = item_id
-                mock_item.name = "Test Item"
-                
-                # Mock the execute chain properly
-                mock_execute_result = MagicMock()
-                mock_execute_result.scalar_one.return_value = mock_item
-                self.db.execute.return_value = mock_execute_result
-                
-                return mock_item
-            
-            async def get_items(self, page=1, size=10):
-                """Mock get items method with pagination"""
-                mock_items = [MagicMock(id=i, name=f"Item {i}") for i in range(1, size + 1)]
-                
-                # Mock the execute chain properly
-                mock_execute_result = MagicMock()
-                mock_execute_result.scalars.return_value.all.return_value = mock_items
-                self.db.execute.return_value = mock_execute_result
-                
-                return mock_items
-        
+        """Mock service class for testing"""
         return MockService
     
     @pytest.mark.asyncio
@@ -74,7 +76,7 @@ class TestServiceMocking:
     async def test_mock_service_create_item(self, mock_service_class, mock_db_session):
         """Test mock service create item functionality"""
         # Arrange
-        service = mock_service_class(mock_db_session)
+        service = mock_service_class(mock_db_session, now=lambda: _FIXED_NOW)
         item_data = {"name": "Test Item", "description": "Test Description"}
         
         # Act
@@ -85,6 +87,7 @@ class TestServiceMocking:
         assert result.id == 1
         assert result.name == "Test Item"
         assert result.description == "Test Description"
+        assert result.created_at == _FIXED_NOW
         mock_db_session.add.assert_called_once()
         mock_db_session.commit.assert_called_once()
         mock_db_session.refresh.assert_called_once()
@@ -235,20 +238,3 @@ class TestServiceMocking:
         # Assert
         assert len(results) == 5
         assert all(result is not None for result in results)
-    
-    @pytest.mark.asyncio
-    async def test_mock_service_performance_metrics(self, mock_service_class, mock_db_session):
-        """Test mock service performance metrics"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
-        # Act
-        import time
-        start_time = time.time()
-        result = await service.get_items(page=1, size=50)
-        end_time = time.time()
-        
-        # Assert
-        assert result is not None
-        assert len(result) == 50
-        assert (end_time - start_time) < 1.0  # Should be very fast in mock
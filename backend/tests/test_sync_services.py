@@ -1,17 +1,147 @@
 """
 Synchronous tests for service layer functionality
+
+Tests share no state: the module-scoped session mock is reset after every
+test, so the file is safe under ``pytest -n auto --dist loadfile``.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, NonCallableMock, call
+
+
+@dataclass(slots=True, frozen=True)
+class _Item:
+    id: int
+    name: str
+
+
+def _spec_item(**attrs):
+    """Mock item restricted to _Item's attributes, so no child mocks are created"""
+    item = NonCallableMock(spec=_Item)
+    item.configure_mock(**attrs)
+    return item
+
+
+_ITEMS = tuple(_Item(id=i, name=f"Item {i}") for i in range(1, 1001))
+_DEFAULT_ITEM = _Item(id=1, name="Test Item")
+_DEFAULT_ITEMS = _ITEMS[:5]
+
+_STATISTICS = MappingProxyType({"total_items": 100, "active_items": 85, "inactive_items": 15})
+_PERFORMANCE = MappingProxyType({"response_time": 0.05, "memory_usage": "10MB", "cpu_usage": "5%"})
+_TRANSFORMED = MappingProxyType({"id": 1, "name": "Transformed Item", "status": "active"})
+_METRICS = MappingProxyType({"request_count": 100, "error_rate": 0.02, "avg_response_time": 0.15})
+_HEALTH = MappingProxyType({"status": "healthy", "timestamp": "2024-01-01T00:00:00Z", "version": "1.0.0"})
+
+_CALL_NO_ARGS = call()
+_CALL_CREATE_TEST = call({"name": "Test"})
+_CALL_TRANSFORM = call({"raw": "data"})
+_CALL_BATCH = call([1, 2, 3])
+
+_PATCH_CASES = [
+    ("_calculate_statistics", _STATISTICS, (), _CALL_NO_ARGS),
+    ("_track_performance", _PERFORMANCE, (), _CALL_NO_ARGS),
+    ("_transform_data", _TRANSFORMED, ({"raw": "data"},), _CALL_TRANSFORM),
+    ("_process_batch", [
+        {"id": 1, "status": "success"},
+        {"id": 2, "status": "success"},
+        {"id": 3, "status": "failed"}
+    ], ([1, 2, 3],), _CALL_BATCH),
+    ("_collect_metrics", _METRICS, (), _CALL_NO_ARGS),
+    ("_check_health", _HEALTH, (), _CALL_NO_ARGS),
+]
+
+
+class MockService:
+    """Minimal synchronous service used to exercise the mocking helpers"""
+
+    def __init__(self, db):
+        self.db = db
+        self._last_id = None
+        self._last_size = 0
+
+        # Configure the execute() result once; calls only record what to return
+        result = db.execute.return_value
+        result.scalar_one.side_effect = lambda: _Item(id=self._last_id, name="Test Item")
+        result.scalars.return_value.all.side_effect = lambda: list(_ITEMS[:self._last_size])
+
+    def create_item(self, data):
+        mock_item = SimpleNamespace(
+            id=1,
+            name=data.get("name", "Test Item"),
+            description=data.get("description", "Test Description")
+        )
+
+        # Validate required fields
+        if not data.get("name"):
+            raise KeyError("Name is required")
+
+        self.db.add(mock_item)
+        self.db.commit()
+        self.db.refresh(mock_item)
+
+        return mock_item
+
+    def get_item_by_id(self, item_id):
+        self._last_id = item_id
+        return self.db.execute().scalar_one()
+
+    def get_items(self, page=1, size=10):
+        self._last_size = size
+        return self.db.execute().scalars().all()
+
+    def _calculate_statistics(self):
+        """Calculate basic statistics"""
+        return _STATISTICS
+
+    def _track_performance(self):
+        """Track performance metrics"""
+        return _PERFORMANCE
+
+    def _transform_data(self, data):
+        """Transform raw data"""
+        return _TRANSFORMED
+
+    def _process_batch(self, items):
+        """Process items in batch"""
+        return [
+            {"id": item, "status": "success"} if item <= 2 else {"id": item, "status": "failed"}
+            for item in items
+        ]
+
+    def _get_cached_item(self, key):
+        """Get item from cache"""
+        cached_value = self._get_from_cache(key)
+        if cached_value is None:
+            # Simulate cache miss and set value
+            self._set_in_cache(key, "cached_value")
+        return cached_value or "cached_value"
+
+    def _get_from_cache(self, key):
+        """Get value from cache"""
+        return None  # Simulate cache miss
+
+    def _set_in_cache(self, key, value):
+        """Set value in cache"""
+        return True
+
+    def _collect_metrics(self):
+        """Collect service metrics"""
+        return _METRICS
+
+    def _check_health(self):
+        """Check service health"""
+        return _HEALTH
 
 
 class TestSyncServiceLayer:
     """Test synchronous service layer functionality"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_db_session(self):
-        """Mock database session with common methods"""
+        """Mock database session with common methods, built once per module"""
         mock = MagicMock()
         mock.add = MagicMock()
         mock.commit = MagicMock()
@@ -23,134 +153,50 @@ class TestSyncServiceLayer:
         
         # Configure default return values
         mock_result = MagicMock()
-        mock_item = MagicMock()
-        mock_item.id = 1
-        mock_item.name = "Test Item"
-        mock_result.scalar_one.return_value = mock_item
-        mock_result.scalars.return_value.all.return_value = [
-            MagicMock(id=i, name=f"Item {i}") for i in range(1, 6)
-        ]
+        mock_result.scalar_one.return_value = _DEFAULT_ITEM
+        mock_result.scalars.return_value.all.return_value = list(_DEFAULT_ITEMS)
         mock.execute.return_value = mock_result
         
         return mock
     
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _reset_db_mock(self, mock_db_session):
+        """Clear calls and side effects left behind by each test"""
+        yield
+        mock_db_session.reset_mock(return_value=False, side_effect=True)
+        
+        # reset_mock() does not pass side_effect=True down to return values,
+        # so drop the callables MockService.__init__ bound to its instance
+        result = mock_db_session.execute.return_value
+        result.scalar_one.side_effect = None
+        result.scalars.return_value.all.side_effect = None
+    
+    @pytest.fixture(scope="session")
     def mock_service_class(self):
         """Mock service class for testing"""
-        class MockService:
-            def __init__(self, db):
-                self.db = db
-            
-            def create_item(self, data):
-                mock_item = MagicMock()
-                mock_item.id = 1
-                mock_item.name = data.get("name", "Test Item")
-                mock_item.description = data.get("description", "Test Description")
-                
-                # Validate required fields
-                if not data.get("name"):
-                    raise KeyError("Name is required")
-                
-                self.db.add(mock_item)
-                self.db.commit()
-                self.db.refresh(mock_item)
-                
-                return mock_item
-            
-            def get_item_by_id(self, item_id):
-                # Create a mock item with the correct ID
-                mock_item = MagicMock()
-                mock_item.id = item_id  # Use the actual item_id parameter
-                mock_item.name = "Test Item"
-                
-                # Call database methods to satisfy test expectations
-                mock_result = MagicMock()
-                mock_result.scalar_one.return_value = mock_item
-                self.db.execute.return_value = mock_result
-                
-                return self.db.execute().scalar_one()
-            
-            def get_items(self, page=1, size=10):
-                # Generate items based on the size parameter
-                mock_items = [MagicMock(id=i, name=f"Item {i}") for i in range(1, size + 1)]
-                
-                # Call database methods to satisfy test expectations
-                mock_result = MagicMock()
-                mock_result.scalars.return_value.all.return_value = mock_items
-                self.db.execute.return_value = mock_result
-                
-                return self.db.execute().scalars().all()
-            
-            def _calculate_statistics(self):
-                """Calculate basic statistics"""
-                return {
-                    "total_items": 100,
-                    "active_items": 85,
-                    "inactive_items": 15
-                }
-            
-            def _track_performance(self):
-                """Track performance metrics"""
-                return {
-                    "response_time": 0.05,
-                    "memory_usage": "10MB",
-                    "cpu_usage": "5%"
-                }
-            
-            def _transform_data(self, data):
-                """Transform raw data"""
-                return {
-                    "id": 1,
-                    "name": "Transformed Item",
-                    "status": "active"
-                }
-            
-            def _process_batch(self, items):
-                """Process items in batch"""
-                return [
-                    {"id": item, "status": "success"} if item <= 2 else {"id": item, "status": "failed"}
-                    for item in items
-                ]
-            
-            def _get_cached_item(self, key):
-                """Get item from cache"""
-                cached_value = self._get_from_cache(key)
-                if cached_value is None:
-                    # Simulate cache miss and set value
-                    self._set_in_cache(key, "cached_value")
-                return cached_value or "cached_value"
-            
-            def _get_from_cache(self, key):
-                """Get value from cache"""
-                return None  # Simulate cache miss
-            
-            def _set_in_cache(self, key, value):
-                """Set value in cache"""
-                return True
-            
-            def _collect_metrics(self):
-                """Collect service metrics"""
-                return {
-                    "request_count": 100,
-                    "error_rate": 0.02,
-                    "avg_response_time": 0.15
-                }
-            
-            def _check_health(self):
-                """Check service health"""
-                return {
-                    "status": "healthy",
-                    "timestamp": "2024-01-01T00:00:00Z",
-                    "version": "1.0.0"
-                }
-        
         return MockService
     
-    def test_mock_service_creation(self, mock_service_class, mock_db_session):
+    @pytest.fixture
+    def service(self, mock_service_class, mock_db_session):
+        """Mock service instance bound to the shared session mock"""
+        return mock_service_class(mock_db_session)
+    
+    @pytest.fixture
+    def failing_db_session(self):
+        """Session mock whose execute() raises a database error"""
+        mock = MagicMock()
+        mock.execute.side_effect = Exception("Database error")
+        return mock
+    
+    @pytest.fixture
+    def failing_commit_session(self):
+        """Session mock whose commit() raises"""
+        mock = MagicMock()
+        mock.commit.side_effect = Exception("Commit failed")
+        return mock
+    
+    def test_mock_service_creation(self, service, mock_db_session):
         """Test creating a mock service instance"""
-        # Arrange & Act
-        service = mock_service_class(mock_db_session)
-        
         # Assert
         assert service is not None
         assert service.db == mock_db_session
@@ -158,10 +204,9 @@ class TestSyncServiceLayer:
         assert hasattr(service, 'get_item_by_id')
         assert hasattr(service, 'get_items')
     
-    def test_mock_service_create_item(self, mock_service_class, mock_db_session):
+    def test_mock_service_create_item(self, service, mock_db_session):
         """Test mock service create item functionality"""
         # Arrange
-        service = mock_service_class(mock_db_session)
         item_data = {"name": "Test Item", "description": "Test Description"}
         
         # Act
@@ -176,10 +221,9 @@ class TestSyncServiceLayer:
         mock_db_session.commit.assert_called_once()
         mock_db_session.refresh.assert_called_once()
     
-    def test_mock_service_get_item_by_id(self, mock_service_class, mock_db_session):
+    def test_mock_service_get_item_by_id(self, service, mock_db_session):
         """Test mock service get item by ID functionality"""
         # Arrange
-        service = mock_service_class(mock_db_session)
         item_id = 5
         
         # Act
@@ -191,10 +235,9 @@ class TestSyncServiceLayer:
         assert result.name == "Test Item"
         mock_db_session.execute.assert_called_once()
     
-    def test_mock_service_get_items(self, mock_service_class, mock_db_session):
+    def test_mock_service_get_items(self, service, mock_db_session):
         """Test mock service get items functionality"""
         # Arrange
-        service = mock_service_class(mock_db_session)
         page = 2
         size = 5
         
@@ -212,9 +255,7 @@ class TestSyncServiceLayer:
         """Test mock service using patch decorator"""
         # Arrange
         mock_service = MagicMock()
-        mock_item = MagicMock()
-        mock_item.id = 1
-        mock_item.name = "Patched Item"
+        mock_item = _spec_item(id=1, name="Patched Item")
         mock_service.create_item = MagicMock(return_value=mock_item)
         
         # Act
@@ -224,37 +265,33 @@ class TestSyncServiceLayer:
         assert result is not None
         assert result.id == 1
         assert result.name == "Patched Item"
-        mock_service.create_item.assert_called_once_with({"name": "Test"})
+        calls = mock_service.create_item.call_args_list
+        assert calls == [_CALL_CREATE_TEST], calls
     
-    def test_mock_service_error_handling(self, mock_service_class, mock_db_session):
+    def test_mock_service_error_handling(self, mock_service_class, failing_db_session):
         """Test mock service error handling"""
         # Arrange
-        service = mock_service_class(mock_db_session)
-        mock_db_session.execute.side_effect = Exception("Database error")
+        service = mock_service_class(failing_db_session)
         
         # Act & Assert
         with pytest.raises(Exception, match="Database error"):
             service.get_item_by_id(1)
     
-    def test_mock_service_transaction_rollback(self, mock_service_class, mock_db_session):
+    def test_mock_service_transaction_rollback(self, mock_service_class, failing_commit_session):
         """Test mock service transaction rollback"""
         # Arrange
-        service = mock_service_class(mock_db_session)
-        mock_db_session.commit.side_effect = Exception("Commit failed")
+        service = mock_service_class(failing_commit_session)
         
         # Act & Assert
         with pytest.raises(Exception, match="Commit failed"):
             service.create_item({"name": "Test"})
         
         # Verify rollback would be called in real implementation
-        mock_db_session.add.assert_called_once()
-        mock_db_session.commit.assert_called_once()
+        failing_commit_session.add.assert_called_once()
+        failing_commit_session.commit.assert_called_once()
     
-    def test_mock_service_validation(self, mock_service_class, mock_db_session):
+    def test_mock_service_validation(self, service):
         """Test mock service input validation"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
         # Act & Assert
         with pytest.raises(KeyError):
             service.create_item({})  # Missing required fields
@@ -264,43 +301,25 @@ class TestSyncServiceLayer:
         assert result is not None
         assert result.name == "Valid Item"
     
-    def test_mock_service_pagination_logic(self, mock_service_class, mock_db_session):
+    @pytest.mark.parametrize("page,size", [(1, 5), (2, 10), (3, 3)])
+    def test_mock_service_pagination_logic(self, service, page, size):
         """Test mock service pagination logic"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
-        # Test different page sizes
-        test_cases = [
-            (1, 5),   # Page 1, size 5
-            (2, 10),  # Page 2, size 10
-            (3, 3),   # Page 3, size 3
-        ]
+        # Act
+        result = service.get_items(page=page, size=size)
         
-        for page, size in test_cases:
-            # Act
-            result = service.get_items(page=page, size=size)
-            
-            # Assert
-            assert result is not None
-            assert len(result) == size
-            assert result[0].id == 1
-            assert result[-1].id == size
+        # Assert
+        assert result is not None
+        assert len(result) == size
+        assert result[0].id == 1
+        assert result[-1].id == size
     
-    def test_mock_service_search_functionality(self, mock_service_class, mock_db_session):
+    def test_mock_service_search_functionality(self, service):
         """Test mock service search functionality"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
         # Mock search results with properly configured attributes
-        search_result_1 = MagicMock()
-        search_result_1.id = 1
-        search_result_1.name = "Search Result 1"
-        
-        search_result_2 = MagicMock()
-        search_result_2.id = 2
-        search_result_2.name = "Search Result 2"
-        
-        search_results = [search_result_1, search_result_2]
+        search_results = [
+            _spec_item(id=1, name="Search Result 1"),
+            _spec_item(id=2, name="Search Result 2")
+        ]
         
         # Override the get_items method to return search results
         service.get_items = MagicMock(return_value=search_results)
@@ -314,197 +333,62 @@ class TestSyncServiceLayer:
         assert result[0].name == "Search Result 1"
         assert result[1].name == "Search Result 2"
     
-    def test_mock_service_statistics(self, mock_service_class, mock_db_session):
-        """Test mock service statistics functionality"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
-        # Mock statistics calculation
-        with patch.object(service, '_calculate_statistics') as mock_calc:
-            mock_calc.return_value = {
-                "total_items": 100,
-                "active_items": 85,
-                "inactive_items": 15
-            }
-            
-            # Act
-            result = service._calculate_statistics()
-            
-            # Assert
-            assert result is not None
-            assert result["total_items"] == 100
-            assert result["active_items"] == 85
-            assert result["inactive_items"] == 15
-            mock_calc.assert_called_once()
-
-    def test_mock_service_concurrent_access(self, mock_service_class, mock_db_session):
+    def test_mock_service_concurrent_access(self, service):
         """Test mock service concurrent access handling"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
-        # Simulate concurrent access with multiple calls
-        results = []
-        for _ in range(5):
-            result = service.get_item_by_id(1)
-            results.append(result)
+        # Act
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(service.get_item_by_id, [1] * 5))
         
         # Assert
         assert len(results) == 5
         assert all(result is not None for result in results)
         assert all(result.id == 1 for result in results)
 
-    def test_mock_service_performance_metrics(self, mock_service_class, mock_db_session):
-        """Test mock service performance metrics"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
+    def test_mock_service_cache_functionality(self, service, monkeypatch):
+        """Test mock service cache functionality"""
+        # Mock cache operations
+        mock_cache_get = MagicMock(return_value=None)  # Cache miss
+        mock_cache_set = MagicMock(return_value=True)
+        monkeypatch.setattr(service, '_get_from_cache', mock_cache_get)
+        monkeypatch.setattr(service, '_set_in_cache', mock_cache_set)
         
-        # Mock performance tracking
-        with patch.object(service, '_track_performance') as mock_track:
-            mock_track.return_value = {
-                "response_time": 0.05,
-                "memory_usage": "10MB",
-                "cpu_usage": "5%"
-            }
-            
-            # Act
-            result = service._track_performance()
-            
-            # Assert
-            assert result is not None
-            assert result["response_time"] < 0.1  # Should be fast
-            assert "MB" in result["memory_usage"]
-            assert "%" in result["cpu_usage"]
-            mock_track.assert_called_once()
-    
-    def test_mock_service_data_transformation(self, mock_service_class, mock_db_session):
-        """Test mock service data transformation"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
+        # Act
+        service._set_in_cache("key", "value")
+        result = service._get_from_cache("key")
         
-        # Mock data transformation
-        with patch.object(service, '_transform_data') as mock_transform:
-            mock_transform.return_value = {
-                "id": 1,
-                "name": "Transformed Item",
-                "status": "active"
-            }
-            
-            # Act
-            result = service._transform_data({"raw": "data"})
-            
-            # Assert
-            assert result is not None
-            assert result["id"] == 1
-            assert result["name"] == "Transformed Item"
-            assert result["status"] == "active"
-            mock_transform.assert_called_once_with({"raw": "data"})
+        # Assert
+        assert result is None  # Because we mocked it to return None
+        mock_cache_set.assert_called_once_with("key", "value")
+        mock_cache_get.assert_called_once_with("key")
     
-    def test_mock_service_cache_functionality(self, mock_service_class, mock_db_session):
-        """Test mock service cache functionality"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
-        
+    def test_mock_service_caching(self, service, monkeypatch):
+        """Test mock service caching functionality"""
         # Mock cache operations
-        with patch.object(service, '_get_from_cache') as mock_cache_get, \
-             patch.object(service, '_set_in_cache') as mock_cache_set:
-            
-            mock_cache_get.return_value = None  # Cache miss
-            mock_cache_set.return_value = True
-            
-            # Act
-            service._set_in_cache("key", "value")
-            result = service._get_from_cache("key")
-            
-            # Assert
-            assert result is None  # Because we mocked it to return None
-            mock_cache_set.assert_called_once_with("key", "value")
-            mock_cache_get.assert_called_once_with("key")
-    
-    def test_mock_service_batch_operations(self, mock_service_class, mock_db_session):
-        """Test mock service batch operations"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
+        mock_cache_get = MagicMock(return_value=None)  # Cache miss
+        mock_cache_set = MagicMock(return_value=True)
+        monkeypatch.setattr(service, '_get_from_cache', mock_cache_get)
+        monkeypatch.setattr(service, '_set_in_cache', mock_cache_set)
         
-        # Mock batch processing
-        with patch.object(service, '_process_batch') as mock_batch:
-            mock_batch.return_value = [
-                {"id": 1, "status": "success"},
-                {"id": 2, "status": "success"},
-                {"id": 3, "status": "failed"}
-            ]
-            
-            # Act
-            result = service._process_batch([1, 2, 3])
-            
-            # Assert
-            assert result is not None
-            assert len(result) == 3
-            assert result[0]["status"] == "success"
-            assert result[1]["status"] == "success"
-            assert result[2]["status"] == "failed"
-            mock_batch.assert_called_once_with([1, 2, 3])
-
-    def test_mock_service_caching(self, mock_service_class, mock_db_session):
-        """Test mock service caching functionality"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
+        # Act
+        result = service._get_cached_item("test_key")
         
-        # Mock cache operations
-        with patch.object(service, '_get_from_cache') as mock_cache_get, \
-             patch.object(service, '_set_in_cache') as mock_cache_set:
-            
-            mock_cache_get.return_value = None  # Cache miss
-            mock_cache_set.return_value = True
-            
-            # Act
-            result = service._get_cached_item("test_key")
-            
-            # Assert
-            mock_cache_get.assert_called_once_with("test_key")
-            mock_cache_set.assert_called_once()
-
-    def test_mock_service_metrics_collection(self, mock_service_class, mock_db_session):
-        """Test mock service metrics collection"""
+        # Assert
+        mock_cache_get.assert_called_once_with("test_key")
+        mock_cache_set.assert_called_once()
+
+    @pytest.mark.parametrize("method,return_value,args,expected_call", _PATCH_CASES, ids=[c[0] for c in _PATCH_CASES])
+    def test_patched_method(
+        self, service, monkeypatch, method, return_value, args, expected_call
+    ):
+        """Test patched helper methods return their configured values"""
         # Arrange
-        service = mock_service_class(mock_db_session)
+        mock_method = MagicMock(return_value=return_value)
+        monkeypatch.setattr(service, method, mock_method)
         
-        # Mock metrics collection
-        with patch.object(service, '_collect_metrics') as mock_metrics:
-            mock_metrics.return_value = {
-                "request_count": 100,
-                "error_rate": 0.02,
-                "avg_response_time": 0.15
-            }
-            
-            # Act
-            result = service._collect_metrics()
-            
-            # Assert
-            assert result is not None
-            assert result["request_count"] == 100
-            assert result["error_rate"] == 0.02
-            assert result["avg_response_time"] == 0.15
-            mock_metrics.assert_called_once()
-
-    def test_mock_service_health_check(self, mock_service_class, mock_db_session):
-        """Test mock service health check"""
-        # Arrange
-        service = mock_service_class(mock_db_session)
+        # Act
+        result = getattr(service, method)(*args)
         
-        # Mock health check
-        with patch.object(service, '_check_health') as mock_health:
-            mock_health.return_value = {
-                "status": "healthy",
-                "timestamp": "2024-01-01T00:00:00Z",
-                "version": "1.0.0"
-            }
-            
-            # Act
-            result = service._check_health()
-            
-            # Assert
-            assert result is not None
-            assert result["status"] == "healthy"
-            assert "timestamp" in result
-            assert "version" in result
-            mock_health.assert_called_once()
+        # Assert
+        assert result == return_value
+        calls = mock_method.call_args_list
+        assert calls == [expected_call], calls